@@ -1,6 +1,6 @@
 'use client';
 
-import React, { useState, useEffect, useCallback } from 'react';
+import React, { useState, useEffect, useCallback, useRef } from 'react';
 import { useRouter } from 'next/navigation';
 import { getSupabaseClient } from '@/lib/supabase';
 import type { Session } from '@supabase/supabase-js';
@@ -13,7 +13,7 @@ import Notification, { NotificationMessage, NotificationType } from '@/component
 import GlobalSearch from '@/components/GlobalSearch';
 import OnboardingModal from '@/components/OnboardingModal';
 import { fetchUserList, updateUserListEntry, removeFromUserList } from '@/services/listService';
-import { syncGoogleUserData, getUserProfile } from '@/services/userService';
+import { syncGoogleUserData, userProfileExists } from '@/services/userService';
 import { fetchPublishedContent } from '@/services/contentService';
 import { getContentUrl, getPersonUrl } from '@/lib/urlHelper';
 import type { Content } from '@/types';
@@ -34,6 +34,9 @@ export default function AppShell({ children }: { children: React.ReactNode }) {
   const [notification, setNotification] = useState<NotificationMessage | null>(null);
   const [playingVideoId, setPlayingVideoId] = useState<string | null>(null);
 
+  // User whose profile has already been checked this session
+  const profileCheckedFor = useRef<string | null>(null);
+
   // -- Helpers --
   const showNotification = (type: NotificationType, message: string) => {
     setNotification({ id: Date.now().toString(), type, message });
@@ -77,25 +80,37 @@ export default function AppShell({ children }: { children: React.ReactNode }) {
       setSession(session);
       if (!session) {
         setMyListIds([]);
+        profileCheckedFor.current = null;
       } else {
         checkProfile(session);
-        if (session.user.app_metadata.provider === 'google') {
-          syncGoogleUserData(session.user.id, session.user.user_metadata);
-        }
       }
     });
 
     return () => subscription.unsubscribe();
   }, []);
 
+  // Keyed on the user rather than the session object: token refreshes hand
+  // out a new session every hour but do not change whose list it is
   useEffect(() => {
     if (session) loadMyList();
-  }, [session]);
+  }, [session?.user.id]);
 
   const checkProfile = async (currentSession: Session | null) => {
     if (!currentSession) return;
-    const profile = await getUserProfile(currentSession.user.id);
-    if (!profile) setIsOnboardingOpen(true);
+    // getSession, INITIAL_SESSION and hourly TOKEN_REFRESHED all report the
+    // same user; check (and for Google, seed) the profile once rather than on
+    // every auth event
+    if (profileCheckedFor.current === currentSession.user.id) return;
+    profileCheckedFor.current = currentSession.user.id;
+    const hasProfile = await userProfileExists(currentSession.user.id);
+    if (hasProfile) return;
+
+    // New users always get onboarding. Google users are seeded only after the
+    // check, so the seed can't make the modal depend on which request lands first
+    setIsOnboardingOpen(true);
+    if (currentSession.user.app_metadata.provider === 'google') {
+      syncGoogleUserData(currentSession.user.id, currentSession.user.user_metadata);
+    }
   };
 
   // -- Handlers --
@@ -1,6 +1,7 @@
-import { createClient } from '@supabase/supabase-js';
+import { createClient, SupabaseClient } from '@supabase/supabase-js';
 import { NextRequest, NextResponse } from 'next/server';
 import { generateEmbedding } from '@/lib/cloudflare-ai';
+import { containsPattern, quoteFilterValue } from '@/lib/queryHelpers';
 
 interface ContentResult {
   id: string;
@@ -15,6 +16,18 @@ interface ContentResult {
   similarity_score: number;
 }
 
+let serviceClient: SupabaseClient | null = null;
+
+// Reused across requests on a warm instance instead of rebuilt per search
+function getServiceClient(): SupabaseClient {
+  if (!serviceClient) {
+    const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!;
+    const serviceRoleKey = process.env.SUPABASE_SERVICE_ROLE_KEY!;
+    serviceClient = createClient(supabaseUrl, serviceRoleKey);
+  }
+  return serviceClient;
+}
+
 export async function POST(request: NextRequest) {
   try {
     const body = await request.json();
@@ -24,17 +37,20 @@ export async function POST(request: NextRequest) {
       return NextResponse.json({ error: 'query is required' }, { status: 400 });
     }
 
-    const supabaseUrl = process.env.NEXT_PUBLIC_SUPABASE_URL!;
-    const serviceRoleKey = process.env.SUPABASE_SERVICE_ROLE_KEY!;
-    const supabase = createClient(supabaseUrl, serviceRoleKey);
-
-    // 1. Keyword search — ILIKE on title and overview
-    const { data: keywordResults, error: keywordError } = await supabase
-      .from('content')
-      .select('id, gdvg_id, title, content_type, poster_path, overview, genres, vote_average, origin_country')
-      .or(`title.ilike.%${query}%,overview.ilike.%${query}%`)
-      .eq('status', 'published')
-      .limit(20);
+    const supabase = getServiceClient();
+
+    // 1. Keyword search — ILIKE on title and overview — and 2. the embedding
+    // for semantic search. Neither depends on the other, so run them together
+    const pattern = quoteFilterValue(containsPattern(query));
+    const [{ data: keywordResults, error: keywordError }, embedding] = await Promise.all([
+      supabase
+        .from('content')
+        .select('id, gdvg_id, title, content_type, poster_path, overview, genres, vote_average, origin_country')
+        .or(`title.ilike.${pattern},overview.ilike.${pattern}`)
+        .eq('status', 'published')
+        .limit(20),
+      generateEmbedding(query),
+    ]);
 
     if (keywordError) {
       console.error('Keyword search error:', keywordError);
@@ -45,8 +61,7 @@ export async function POST(request: NextRequest) {
       similarity_score: 0,
     }));
 
-    // 2. Generate embedding for semantic search
-    const embedding = await generateEmbedding(query);
+    // Vector search with the embedding, if one came back
     let vectorItems: ContentResult[] = [];
     let semantic = false;
 
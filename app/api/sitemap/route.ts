@@ -1,31 +1,45 @@
-import { createClient } from '@supabase/supabase-js';
+import { createClient, SupabaseClient } from '@supabase/supabase-js';
 import { NextRequest } from 'next/server';
+import { createSlug, CONTENT_TYPE_PREFIXES } from '@/lib/urlHelper';
 
 export const dynamic = 'force-dynamic';
 
 const SITE_URL = (process.env.NEXT_PUBLIC_SITE_URL || 'https://gdvg-ten.vercel.app').replace(/\/$/, '');
 const PAGE_SIZE = 45000;
+const PEOPLE_COUNT_TTL_MS = 10 * 60 * 1000;
 
-function slug(title: string): string {
-  if (!title) return '';
-  return title.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '').substring(0, 50);
-}
+let peopleCountCache: { value: number; expiresAt: number } | null = null;
+let client: SupabaseClient | null = null;
 
 function prefix(contentType: string): string {
-  switch (contentType) {
-    case 'movie':       return 'movies';
-    case 'drama':       return 'drama';
-    case 'anime':       return 'anime';
-    case 'variety':     return 'variety';
-    case 'documentary': return 'documentary';
-    default:            return 'series'; // tv
-  }
+  return CONTENT_TYPE_PREFIXES.get(contentType) ?? 'series'; // tv
 }
 
-function supabase() {
+// One client per warm instance; every sitemap page reuses it
+function supabase(): SupabaseClient {
+  if (client) return client;
   const url = process.env.NEXT_PUBLIC_SUPABASE_URL || '';
   const key = process.env.SUPABASE_SERVICE_ROLE_KEY || process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || '';
-  return createClient(url, key);
+  client = createClient(url, key);
+  return client;
+}
+
+// Crawlers hit the index repeatedly; the exact count scans the whole table,
+// so reuse it for a few minutes instead of recounting on every request
+async function peopleCount(db: ReturnType<typeof supabase>): Promise<number> {
+  const now = Date.now();
+  if (peopleCountCache && peopleCountCache.expiresAt > now) {
+    return peopleCountCache.value;
+  }
+
+  const { count, error } = await db
+    .from('people')
+    .select('id', { count: 'exact', head: true });
+
+  if (error) return peopleCountCache?.value ?? 0;
+
+  peopleCountCache = { value: count || 0, expiresAt: now + PEOPLE_COUNT_TTL_MS };
+  return peopleCountCache.value;
 }
 
 function xml(body: string) {
@@ -37,6 +51,12 @@ function xml(body: string) {
   });
 }
 
+// W3C date (YYYY-MM-DD) sliced from the ISO timestamp Postgres already returns,
+// instead of a Date parse + toISOString() for every one of up to 45k rows
+function lastmod(timestamp: string | null | undefined, fallback: string): string {
+  return timestamp ? timestamp.slice(0, 10) : fallback;
+}
+
 function urlEntry(loc: string, lastmod: string, changefreq: string, priority: string) {
   return (
     `\n  <url>` +
@@ -53,15 +73,11 @@ export async function GET(request: NextRequest) {
   const type = searchParams.get('type');
   const page = Math.max(1, parseInt(searchParams.get('page') || '1'));
   const db = supabase();
-  const today = new Date().toISOString();
+  const today = new Date().toISOString().slice(0, 10);
 
   // ── Sitemap Index ────────────────────────────────────────────────────────────
   if (!type) {
-    const { count: peopleCount } = await db
-      .from('people')
-      .select('id', { count: 'exact', head: true });
-
-    const peoplePages = Math.ceil((peopleCount || 0) / PAGE_SIZE);
+    const peoplePages = Math.ceil((await peopleCount(db)) / PAGE_SIZE);
 
     let out = `<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">`;
     out += `\n  <sitemap><loc>${SITE_URL}/api/sitemap?type=static</loc><lastmod>${today}</lastmod></sitemap>`;
@@ -101,12 +117,11 @@ export async function GET(request: NextRequest) {
     let out = `<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">`;
     for (const item of data || []) {
       const urlPrefix = prefix(item.content_type);
-      const s = slug(item.title);
+      const s = item.title ? createSlug(item.title) : '';
       const loc = s
         ? `${SITE_URL}/${urlPrefix}/${item.gdvg_id}/${s}`
         : `${SITE_URL}/${urlPrefix}/${item.gdvg_id}`;
-      const lastmod = item.updated_at ? new Date(item.updated_at).toISOString() : today;
-      out += urlEntry(loc, lastmod, 'weekly', '0.7');
+      out += urlEntry(loc, lastmod(item.updated_at, today), 'weekly', '0.7');
     }
     out += '\n</urlset>';
     return xml(out);
@@ -129,12 +144,11 @@ export async function GET(request: NextRequest) {
 
     let out = `<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">`;
     for (const person of data || []) {
-      const s = slug(person.name);
+      const s = person.name ? createSlug(person.name) : '';
       const loc = s
         ? `${SITE_URL}/people/${person.gdvg_id}/${s}`
         : `${SITE_URL}/people/${person.gdvg_id}`;
-      const lastmod = person.updated_at ? new Date(person.updated_at).toISOString() : today;
-      out += urlEntry(loc, lastmod, 'monthly', '0.5');
+      out += urlEntry(loc, lastmod(person.updated_at, today), 'monthly', '0.5');
     }
     out += '\n</urlset>';
     return xml(out);
@@ -1,3 +1,4 @@
+import { cache } from 'react';
 import { createPublicClient } from '@/lib/supabase/public';
 import { fetchContentBySlug } from '@/services/contentService';
 import { buildContentMetadata } from './metadata';
@@ -5,12 +6,17 @@ import { buildContentJsonLd } from './jsonLd';
 import type { Metadata } from 'next';
 import type { Content } from '@/types';
 
+// generateMetadata and the page both resolve the same id during one render;
+// cache() keyed on the id string lets them share a single query
+const fetchContentDetail = cache(async (id: string): Promise<Content | null> => {
+  const supabase = createPublicClient();
+  return fetchContentBySlug(decodeURIComponent(id), supabase);
+});
+
 export async function getContentDetail(
   params: { id: string; slug: string }
 ): Promise<Content | null> {
-  const supabase = createPublicClient();
-  const content = await fetchContentBySlug(decodeURIComponent(params.id), supabase);
-  return content;
+  return fetchContentDetail(params.id);
 }
 
 export async function generateContentMetadata(
@@ -1,12 +1,13 @@
 import type { Metadata } from 'next';
 import type { Content, Person } from '@/types';
 import { getPosterUrl, getProfileUrl } from '@/lib/tmdbImages';
+import { createSlug } from '@/lib/urlHelper';
 
 const SITE_URL = process.env.NEXT_PUBLIC_SITE_URL || 'https://gdvg-ten.vercel.app';
 
 export function buildContentMetadata(content: Content, prefix: string): Metadata {
   const posterUrl = getPosterUrl(content.poster_path) || '';
-  const canonicalUrl = `${SITE_URL}/${prefix}/${content.gdvg_id}/${content.title ? content.title.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '').substring(0, 50) : ''}`;
+  const canonicalUrl = `${SITE_URL}/${prefix}/${content.gdvg_id}/${content.title ? createSlug(content.title) : ''}`;
 
   return {
     title: content.title,
@@ -32,7 +33,7 @@ export function buildContentMetadata(content: Content, prefix: string): Metadata
 
 export function buildPersonMetadata(person: Person): Metadata {
   const profileUrl = getProfileUrl(person.profile_path) || '';
-  const canonicalUrl = `${SITE_URL}/people/${person.gdvg_id}/${person.name ? person.name.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '').substring(0, 50) : ''}`;
+  const canonicalUrl = `${SITE_URL}/people/${person.gdvg_id}/${person.name ? createSlug(person.name) : ''}`;
 
   return {
     title: person.name,
@@ -1,5 +1,7 @@
+import { cache } from 'react';
 import { createPublicClient } from '@/lib/supabase/public';
 import { getPersonByName } from '@/services/personService';
+import { createSlug } from '@/lib/urlHelper';
 import { buildPersonMetadata } from './metadata';
 import { buildPersonJsonLd } from './jsonLd';
 import type { Metadata } from 'next';
@@ -7,12 +9,16 @@ import type { Person } from '@/types';
 
 const SITE_URL = process.env.NEXT_PUBLIC_SITE_URL || 'https://gdvg-ten.vercel.app';
 
+// Shared between generateMetadata and the page within one render
+const fetchPersonDetail = cache(async (id: string): Promise<Person | null> => {
+  const supabase = createPublicClient();
+  return getPersonByName(decodeURIComponent(id), supabase);
+});
+
 export async function getPersonDetail(
   params: { id: string; slug: string }
 ): Promise<Person | null> {
-  const supabase = createPublicClient();
-  const person = await getPersonByName(decodeURIComponent(params.id), supabase);
-  return person;
+  return fetchPersonDetail(params.id);
 }
 
 export async function generatePersonMetadata(
@@ -28,7 +34,7 @@ export async function generatePersonMetadata(
 }
 
 export function renderPersonJsonLd(person: Person) {
-  const slug = person.name ? person.name.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '').substring(0, 50) : '';
+  const slug = person.name ? createSlug(person.name) : '';
   const canonicalUrl = `${SITE_URL}/people/${person.gdvg_id}/${slug}`;
   const jsonLd = buildPersonJsonLd(person, canonicalUrl);
   return (
@@ -5,8 +5,7 @@ import { useRouter } from 'next/navigation';
 import MyListPage from '@/components/MyListPage';
 import { useApp } from '../AppContext';
 import { getContentUrl } from '@/lib/urlHelper';
-import { getSupabaseClient } from '@/lib/supabase';
-import { normalizeContentArray } from '@/lib/contentNormalizer';
+import { fetchContentByIds } from '@/services/contentService';
 import type { Content } from '@/types';
 
 export default function MyListClient() {
@@ -24,15 +23,7 @@ export default function MyListClient() {
     const fetchListContent = async () => {
       setIsFetchingContent(true);
       try {
-        const { data, error } = await getSupabaseClient()
-          .from('content')
-          .select('*')
-          .in('id', myListIds)
-          .eq('status', 'published');
-
-        if (!error && data) {
-          setDramas(normalizeContentArray(data));
-        }
+        setDramas(await fetchContentByIds(myListIds));
       } catch (err) {
         console.error('Failed to fetch list content:', err);
       } finally {
@@ -1,5 +1,5 @@
 import { Metadata } from 'next';
-import { createClient } from '@/lib/supabase/server';
+import { createPublicClient } from '@/lib/supabase/public';
 import { fetchPublishedContent, fetchTopRated, fetchRecentlyAdded } from '@/services/contentService';
 import HomePageClient from './HomePageClient';
 
@@ -16,7 +16,9 @@ export default async function HomePage() {
   let recent: any[] = [];
 
   try {
-    const supabase = await createClient();
+    // Cookie-free client: reading auth cookies would opt the page out of
+    // the hourly revalidate and hit Supabase on every visit
+    const supabase = createPublicClient();
     [popular, topRated, recent] = await Promise.all([
       fetchPublishedContent(100, supabase),
       fetchTopRated(20, supabase),
@@ -11,6 +11,19 @@ interface CatalogPageProps {
   initialGenre?: string | null;
 }
 
+// Country code to name mapping
+const COUNTRY_NAMES: Record<string, string> = {
+  KR: 'South Korea',
+  JP: 'Japan',
+  CN: 'China',
+  TW: 'Taiwan',
+  TH: 'Thailand',
+  TR: 'Turkey',
+  IN: 'India',
+  US: 'USA',
+  GB: 'United Kingdom',
+};
+
 const CatalogPage: React.FC<CatalogPageProps> = ({ type, dramas, onDramaClick, initialGenre }) => {
   const [selectedGenre, setSelectedGenre] = useState<string | null>(initialGenre || null);
   const [selectedCountry, setSelectedCountry] = useState<string | null>(null);
@@ -20,19 +33,6 @@ const CatalogPage: React.FC<CatalogPageProps> = ({ type, dramas, onDramaClick, i
   const genreRef = useRef<HTMLDivElement>(null);
   const countryRef = useRef<HTMLDivElement>(null);
 
-  // Country code to name mapping
-  const countryNames: Record<string, string> = {
-    KR: 'South Korea',
-    JP: 'Japan',
-    CN: 'China',
-    TW: 'Taiwan',
-    TH: 'Thailand',
-    TR: 'Turkey',
-    IN: 'India',
-    US: 'USA',
-    GB: 'United Kingdom',
-  };
-
   // Sync with prop updates
   useEffect(() => {
     if (initialGenre) {
@@ -77,7 +77,7 @@ const CatalogPage: React.FC<CatalogPageProps> = ({ type, dramas, onDramaClick, i
     const allCountries = new Set<string>();
     categoryDramas.forEach(d => {
       d.origin_country?.forEach(code => {
-        const name = countryNames[code] || code;
+        const name = COUNTRY_NAMES[code] || code;
         allCountries.add(name);
       });
     });
@@ -91,7 +91,7 @@ const CatalogPage: React.FC<CatalogPageProps> = ({ type, dramas, onDramaClick, i
         ? d.genres?.some(g => g.name === selectedGenre)
         : true;
       const matchCountry = selectedCountry
-        ? d.origin_country?.some(code => (countryNames[code] || code) === selectedCountry)
+        ? d.origin_country?.some(code => (COUNTRY_NAMES[code] || code) === selectedCountry)
         : true;
       return matchGenre && matchCountry;
     });
@@ -3,7 +3,7 @@ import React, { useState, useEffect } from 'react';
 import type { Discussion } from '../types';
 import type { Session } from '@supabase/supabase-js';
 import { fetchDiscussions, createDiscussion } from '../services/contentService';
-import { getUserProfile } from '../services/userService';
+import { getUserProfile, fetchUserProfiles } from '../services/userService';
 import { UserIcon, PlusIcon } from './icons';
 import SafeImage from './SafeImage';
 
@@ -29,14 +29,15 @@ const DiscussionSection: React.FC<DiscussionSectionProps> = ({ dramaId, session,
     const loadDiscussions = async () => {
       try {
         const data = await fetchDiscussions(dramaId);
-        const enriched = await Promise.all(data.map(async (d) => {
-          const profile = await getUserProfile(d.userId);
+        const profiles = await fetchUserProfiles(data.map(d => d.userId));
+        const enriched = data.map((d) => {
+          const profile = profiles.get(d.userId);
           return {
             ...d,
             userDisplayName: profile?.username || 'Anonymous User',
             userAvatar: profile?.avatarUrl || undefined
           };
-        }));
+        });
         setDiscussions(enriched);
       } catch (error) {
         console.error("Failed to load discussions:", error);
@@ -9,7 +9,7 @@ import { PlayIcon, PlusIcon, CheckIcon, ArrowLeftIcon, UserCircleIcon, StarIcon
 import ReviewSection from './ReviewSection';
 import DiscussionSection from './DiscussionSection';
 import { fetchSimilarContent, fetchRecommendations, fetchContentCast, fetchContentCrew, fetchWatchLinks } from '../services/contentService';
-import { fetchUserList, updateUserListEntry, removeFromUserList } from '../services/listService';
+import { fetchUserListEntry, updateUserListEntry, removeFromUserList } from '../services/listService';
 import DramaCard from './DramaCard';
 import AdBanner from './AdBanner';
 import TrackModal from './TrackModal';
@@ -105,34 +105,32 @@ const DramaDetail: React.FC<DramaDetailProps> = ({
         if (!drama) return;
 
         const loadRelated = async () => {
-            // Load cast
-            const cast = await fetchContentCast(drama.id);
-            setCastMembers(cast);
+            // Independent lookups - fetch them together rather than one after another
+            const hasGenres = Array.isArray(drama.genres) && drama.genres.length > 0;
+            const [cast, crew, recs, similar, links, entry] = await Promise.all([
+                fetchContentCast(drama.id),
+                fetchContentCrew(drama.id),
+                // TMDB recommendations (prioritized over genre-based)
+                fetchRecommendations(drama.id, 10),
+                // Similar content as fallback
+                hasGenres ? fetchSimilarContent(drama.id, drama.genres) : Promise.resolve(null),
+                // Watch links (streaming platforms)
+                fetchWatchLinks(drama.id),
+                // User list entry (the only lookup that throws; don't let it sink the rest)
+                session
+                    ? fetchUserListEntry(session.user.id, drama.id).catch(err => {
+                        console.error('Failed to load list entry:', err);
+                        return undefined;
+                    })
+                    : Promise.resolve(undefined),
+            ]);
 
-            // Load crew
-            const crew = await fetchContentCrew(drama.id);
+            setCastMembers(cast);
             setCrewMembers(crew);
-
-            // Load TMDB recommendations (NEW: prioritize over genre-based)
-            const recs = await fetchRecommendations(drama.id, 10);
             setRecommendations(recs);
-
-            // Load similar content as fallback
-            if (Array.isArray(drama.genres) && drama.genres.length > 0) {
-                const similar = await fetchSimilarContent(drama.id, drama.genres);
-                setSimilarContent(similar);
-            }
-
-            // Load watch links (streaming platforms)
-            const links = await fetchWatchLinks(drama.id);
+            if (similar) setSimilarContent(similar);
             setWatchLinks(links);
-
-            // Load user list entry
-            if (session) {
-                const list = await fetchUserList(session.user.id);
-                const entry = list.find(l => l.dramaId === drama.id);
-                setListEntry(entry || null);
-            }
+            if (entry !== undefined) setListEntry(entry);
         };
         loadRelated();
     }, [drama, session]);
@@ -49,7 +49,8 @@ const Home: React.FC<HomeProps> = ({
     const indianDramas = dramas.filter(d => hasCountry(d, 'IN')).slice(0, 10);
     const westernDramas = dramas.filter(d => hasCountry(d, 'US') || hasCountry(d, 'GB')).slice(0, 10);
 
-    const myListDramas = dramas.filter(d => myListIds.includes(d.id));
+    const myListSet = new Set(myListIds);
+    const myListDramas = dramas.filter(d => myListSet.has(d.id));
 
     return (
         <div className="animate-fadeIn">
@@ -58,7 +59,7 @@ const Home: React.FC<HomeProps> = ({
                     drama={featuredDrama}
                     onPlay={onPlay}
                     onMoreInfo={handleDramaClick}
-                    isMyList={myListIds.includes(featuredDrama.id)}
+                    isMyList={myListSet.has(featuredDrama.id)}
                     onToggleMyList={onToggleMyList}
                 />
             )}
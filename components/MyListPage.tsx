@@ -30,14 +30,21 @@ const MyListPage: React.FC<MyListPageProps> = ({ dramas, onDramaClick, isLoading
   const filteredDramas = useMemo(() => {
     if (activeTab === 'All') return dramas;
 
-    const targetIds = userList
-      .filter(entry => entry.status === activeTab)
-      .map(entry => entry.dramaId);
+    const targetIds = new Set(
+      userList
+        .filter(entry => entry.status === activeTab)
+        .map(entry => entry.dramaId)
+    );
 
-    return dramas.filter(d => targetIds.includes(d.id));
+    return dramas.filter(d => targetIds.has(d.id));
   }, [dramas, userList, activeTab]);
 
-  const getEntry = (dramaId: string) => userList.find(e => e.dramaId === dramaId);
+  const entriesByDramaId = useMemo(
+    () => new Map(userList.map(entry => [entry.dramaId, entry])),
+    [userList]
+  );
+
+  const getEntry = (dramaId: string) => entriesByDramaId.get(dramaId);
 
   const tabs: (WatchStatus | 'All')[] = ['All', 'Watching', 'Completed', 'Plan to Watch', 'On Hold', 'Dropped'];
 
@@ -3,7 +3,7 @@ import React, { useState, useEffect } from 'react';
 import type { Review } from '../types';
 import type { Session } from '@supabase/supabase-js';
 import { fetchReviews, addReview } from '../services/contentService';
-import { getUserProfile } from '../services/userService';
+import { getUserProfile, fetchUserProfiles } from '../services/userService';
 import { StarIcon, UserIcon } from './icons';
 import SafeImage from './SafeImage';
 
@@ -30,15 +30,16 @@ const ReviewSection: React.FC<ReviewSectionProps> = ({ dramaId, session, onOpenA
     const loadReviews = async () => {
       try {
         const data = await fetchReviews(dramaId);
+        const profiles = await fetchUserProfiles(data.map(r => r.userId));
 
-        const enriched = await Promise.all(data.map(async (r) => {
-          const profile = await getUserProfile(r.userId);
+        const enriched = data.map((r) => {
+          const profile = profiles.get(r.userId);
           return {
             ...r,
             userDisplayName: profile?.username || r.userEmail.split('@')[0],
             userAvatar: profile?.avatarUrl || undefined
           };
-        }));
+        });
 
         setReviews(enriched);
       } catch (error) {
@@ -66,14 +66,14 @@ const WatchProvidersRegional: React.FC<WatchProvidersRegionalProps> = ({
     const [selectedRegion, setSelectedRegion] = useState(defaultRegion);
 
     // Get available regions from data
-    const availableRegions = watchProviders?.results
-        ? Object.keys(watchProviders.results)
-        : [];
+    const availableRegions = new Set(
+        watchProviders?.results ? Object.keys(watchProviders.results) : []
+    );
 
     // Filter REGIONS to only show those with data
-    const regionsWithData = REGIONS.filter(r => availableRegions.includes(r.code));
+    const regionsWithData = REGIONS.filter(r => availableRegions.has(r.code));
 
-    if (!watchProviders?.results || availableRegions.length === 0) {
+    if (!watchProviders?.results || availableRegions.size === 0) {
         return (
             <div className="text-center py-8 text-gray-500">
                 <p>No streaming information available</p>
@@ -1,5 +1,4 @@
 const CLOUDFLARE_AI_MODEL = '@cf/baai/bge-large-en-v1.5';
-const RATE_LIMIT_DELAY_MS = 100;
 
 const delay = (ms: number) => new Promise<void>(resolve => setTimeout(resolve, ms));
 
@@ -12,8 +11,6 @@ async function fetchEmbedding(text: string): Promise<number[] | null> {
 
     const endpoint = `https://api.cloudflare.com/client/v4/accounts/${accountId}/ai/run/${CLOUDFLARE_AI_MODEL}`;
 
-    await delay(RATE_LIMIT_DELAY_MS);
-
     const maxAttempts = 3;
 
     for (let attempt = 1; attempt <= maxAttempts; attempt++) {
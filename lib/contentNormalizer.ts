@@ -7,10 +7,25 @@
 
 import type { Content } from '../types';
 
+const ARRAY_FIELDS = [
+    'genres',
+    'networks',
+    'videos',
+    'keywords',
+    'production_companies',
+    'origin_country',
+] as const;
+
 /**
  * Normalizes a single content item, ensuring all JSONB array fields are proper arrays
  */
 export function normalizeContent(content: Content): Content {
+    // Rows from Supabase almost always arrive well-formed; return them as-is
+    // rather than copying every field of every row
+    if (ARRAY_FIELDS.every(field => Array.isArray(content[field]))) {
+        return content;
+    }
+
     return {
         ...content,
         // Ensure genres is always an array
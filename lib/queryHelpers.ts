@@ -0,0 +1,50 @@
+/**
+ * Query Helpers
+ *
+ * Utilities for building PostgREST filter values from user-supplied text,
+ * and for keeping .in() filters within request-size limits
+ */
+
+const LIKE_SPECIAL_CHARS_RE = /[\\%_]/g;
+const LIKE_STAR_RE = /\*/g;
+const FILTER_QUOTE_CHARS_RE = /["\\]/g;
+
+/**
+ * Neutralize LIKE/ILIKE wildcards in user input
+ * "%", "_" and backslash are escaped and match literally. PostgREST rewrites every "*"
+ * in a like operand to "%" and offers no escape for it, so "*" becomes the
+ * single-character wildcard "_": it still matches a literal "*" but can no
+ * longer widen into an any-length match
+ * e.g. "100%_Real*" -> "100\%\_Real_"
+ */
+export const escapeLikePattern = (value: string): string =>
+    value.replace(LIKE_SPECIAL_CHARS_RE, '\\$&').replace(LIKE_STAR_RE, '_');
+
+/**
+ * Build an ILIKE pattern matching the value anywhere in the column
+ * e.g. "50%" -> "%50\%%"
+ */
+export const containsPattern = (value: string): string =>
+    `%${escapeLikePattern(value)}%`;
+
+/**
+ * Double-quote a value for use inside a raw .or() filter string, so commas,
+ * dots and parentheses in user input don't break the filter syntax
+ */
+export const quoteFilterValue = (value: string): string =>
+    `"${value.replace(FILTER_QUOTE_CHARS_RE, '\\$&')}"`;
+
+// .in() lookups are GETs with every value in the query string. 100 UUIDs is
+// ~3.7 KB, well under gateway URL-length limits; shorter keys fit easily
+export const IN_FILTER_CHUNK_SIZE = 100;
+
+/**
+ * Split values into IN_FILTER_CHUNK_SIZE slices, one per .in() request
+ */
+export const chunkInFilterValues = <T>(values: T[]): T[][] => {
+    const chunks: T[][] = [];
+    for (let i = 0; i < values.length; i += IN_FILTER_CHUNK_SIZE) {
+        chunks.push(values.slice(i, i + IN_FILTER_CHUNK_SIZE));
+    }
+    return chunks;
+};
@@ -1,8 +1,14 @@
-import { createClient } from '@supabase/supabase-js';
+import { createClient, SupabaseClient } from '@supabase/supabase-js';
+
+let client: SupabaseClient | null = null;
+
+export function createPublicClient(): SupabaseClient {
+  if (client) return client;
 
-export function createPublicClient() {
   const url = process.env.NEXT_PUBLIC_SUPABASE_URL!;
   const key = process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY!;
   if (!url || !key) throw new Error('Supabase env vars missing');
-  return createClient(url, key);
+
+  client = createClient(url, key);
+  return client;
 }
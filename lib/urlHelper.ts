@@ -1,25 +1,26 @@
 import type { Content, Person } from '../types';
 
+// URL id formats, shared with the content/person services
+export const GDVG_ID_RE = /^\d+$/;
+export const UUID_RE = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i;
+export const TRAILING_UUID_RE = /([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$/i;
+export const SHORT_ID_RE = /^[0-9a-f]{8}$/i;
+
+// content_type -> URL prefix
+export const CONTENT_TYPE_PREFIXES: ReadonlyMap<string, string> = new Map([
+    ['tv', 'series'],
+    ['movie', 'movies'],
+    ['drama', 'drama'],
+    ['anime', 'anime'],
+    ['variety', 'variety'],
+    ['documentary', 'documentary'],
+]);
+
 /**
  * Get the content type prefix for URLs
  */
 export function getContentTypePrefix(contentType: string): string {
-    switch (contentType.toLowerCase()) {
-        case 'tv':
-            return 'series';
-        case 'movie':
-            return 'movies';
-        case 'drama':
-            return 'drama';
-        case 'anime':
-            return 'anime';
-        case 'variety':
-            return 'variety';
-        case 'documentary':
-            return 'documentary';
-        default:
-            return 'title';
-    }
+    return CONTENT_TYPE_PREFIXES.get(contentType.toLowerCase()) ?? 'title';
 }
 
 /**
@@ -61,15 +62,41 @@ export function getContentUrl(content: Content): string {
     return `/${prefix}/${content.gdvg_id}`;
 }
 
+const NON_ASCII_RE = /[^\x00-\x7f]/;
+const NON_ASCII_CHARS_RE = /[^\x00-\x7f]/g;
+const COMBINING_MARKS_RE = /[\u0300-\u036f]/g;
+const SLUG_SEPARATOR_RE = /[^a-z0-9]+/g;
+const SLUG_TRIM_RE = /^-+|-+$/g;
+
+// Lowercase Latin letters -> ASCII. Covers the Latin-1 accented range plus
+// letters that have no decomposition and would otherwise be dropped (ß, æ, ø, ł, œ, đ, þ ...)
+const LATIN_FOLDS: ReadonlyMap<string, string> = new Map(
+    Object.entries({
+        a: 'àáâãäå', ae: 'æ', c: 'ç', d: 'ðđ', e: 'èéêë', h: 'ħ', i: 'ìíîïı',
+        l: 'łŀ', n: 'ñ', o: 'òóôõöø', oe: 'œ', ss: 'ß', t: 'ŧ', th: 'þ',
+        u: 'ùúûü', y: 'ýÿ',
+    }).flatMap(([ascii, chars]) => Array.from(chars, (ch): [string, string] => [ch, ascii]))
+);
+
 /**
  * Create URL-friendly slug from title
+ * Accented Latin letters are folded to ASCII ("Amélie" -> "amelie", "Straße" -> "strasse")
+ * via the LATIN_FOLDS table, with Unicode normalization only as a fallback for
+ * anything the table doesn't cover. Plain ASCII titles skip both steps.
  */
 export function createSlug(title: string): string {
-    return title
-        .toLowerCase()
-        .replace(/[^a-z0-9]+/g, '-') // Replace non-alphanumeric with hyphens
-        .replace(/^-+|-+$/g, '')      // Remove leading/trailing hyphens
-        .substring(0, 50);            // Limit length
+    let text = title.toLowerCase();
+    if (NON_ASCII_RE.test(text)) {
+        text = text.replace(NON_ASCII_CHARS_RE, ch => LATIN_FOLDS.get(ch) ?? ch);
+        if (NON_ASCII_RE.test(text)) {
+            text = text.normalize('NFKD').replace(COMBINING_MARKS_RE, '');
+        }
+    }
+
+    return text
+        .replace(SLUG_SEPARATOR_RE, '-') // Replace non-alphanumeric with hyphens
+        .replace(SLUG_TRIM_RE, '')       // Remove leading/trailing hyphens
+        .substring(0, 50);               // Limit length
 }
 
 /**
@@ -103,19 +130,18 @@ export function getPersonUrl(person: Person): string {
  */
 export function extractIdFromSlug(slugOrId: string): string {
     // Check if it's a pure number (GDVG-ID)
-    if (/^\d+$/.test(slugOrId)) {
+    if (GDVG_ID_RE.test(slugOrId)) {
         return slugOrId;
     }
 
     // Check if it's a full UUID
-    const isUUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i.test(slugOrId);
-    if (isUUID) {
+    if (UUID_RE.test(slugOrId)) {
         return slugOrId;
     }
 
     // Try to extract UUID from the end (for backward compatibility with full UUID URLs)
     // UUID pattern: 8-4-4-4-12 hexadecimal characters separated by hyphens
-    const uuidMatch = slugOrId.match(/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$/i);
+    const uuidMatch = slugOrId.match(TRAILING_UUID_RE);
 
     if (uuidMatch) {
         return uuidMatch[1];
@@ -125,7 +151,7 @@ export function extractIdFromSlug(slugOrId: string): string {
     const parts = slugOrId.split('-');
     const lastPart = parts[parts.length - 1];
 
-    if (/^[0-9a-f]{8}$/i.test(lastPart)) {
+    if (SHORT_ID_RE.test(lastPart)) {
         return lastPart;
     }
 
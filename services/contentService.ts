@@ -7,6 +7,11 @@ import { getSupabaseClient } from '../lib/supabase';
 import type { SupabaseClient } from '@supabase/supabase-js';
 import type { Content, CastMember, CrewMember, Review, Discussion, WatchLink } from '../types';
 import { normalizeContent, normalizeContentArray } from '../lib/contentNormalizer';
+import { GDVG_ID_RE, UUID_RE, TRAILING_UUID_RE, SHORT_ID_RE } from '../lib/urlHelper';
+import { escapeLikePattern, containsPattern } from '../lib/queryHelpers';
+
+// Columns needed to render a DramaCard / search result, without the heavy JSONB fields
+const CONTENT_CARD_COLUMNS = 'id, gdvg_id, title, poster_path, backdrop_path, content_type, release_date, first_air_date, vote_average, origin_country, genres';
 
 // ============ Public Queries (status = 'published') ============
 
@@ -68,6 +73,23 @@ export const fetchContentByCountry = async (
     return normalizeContentArray(data || []);
 };
 
+/**
+ * Fetch card data for a set of published content IDs (e.g. a user's list)
+ */
+export const fetchContentByIds = async (ids: string[], client?: SupabaseClient): Promise<Content[]> => {
+    if (ids.length === 0) return [];
+
+    const sb = client || getSupabaseClient();
+    const { data, error } = await sb
+        .from('content')
+        .select(`${CONTENT_CARD_COLUMNS}, number_of_episodes`)
+        .in('id', ids)
+        .eq('status', 'published');
+
+    if (error) throw error;
+    return normalizeContentArray((data || []) as unknown as Content[]);
+};
+
 /**
  * Fetch single content by ID (published only for public)
  */
@@ -112,19 +134,17 @@ export const fetchContentByGdvgId = async (gdvgId: number | string, client?: Sup
 export const fetchContentBySlug = async (slug: string, client?: SupabaseClient): Promise<Content | null> => {
     const sb = client || getSupabaseClient();
     // Check if it's a pure number (GDVG-ID)
-    if (/^\d+$/.test(slug)) {
+    if (GDVG_ID_RE.test(slug)) {
         return await fetchContentByGdvgId(parseInt(slug, 10), client);
     }
 
     // Check if it's a direct full UUID
-    const isUUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i.test(slug);
-
-    if (isUUID) {
+    if (UUID_RE.test(slug)) {
         return await fetchContentById(slug, client);
     }
 
     // Try to extract full UUID from end (backward compatibility)
-    const uuidMatch = slug.match(/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$/i);
+    const uuidMatch = slug.match(TRAILING_UUID_RE);
     if (uuidMatch) {
         return await fetchContentById(uuidMatch[1], client);
     }
@@ -133,12 +153,16 @@ export const fetchContentBySlug = async (slug: string, client?: SupabaseClient):
     const parts = slug.split('-');
     const lastPart = parts[parts.length - 1];
 
-    if (/^[0-9a-f]{8}$/i.test(lastPart)) {
+    if (SHORT_ID_RE.test(lastPart)) {
+        // Bounded range on the uuid primary key instead of ILIKE on id::text,
+        // so Postgres can seek the index rather than scan every row
+        const shortId = lastPart.toLowerCase();
         const { data, error } = await sb
             .from('content')
             .select('*')
             .eq('status', 'published')
-            .filter('id', 'ilike', `${lastPart.toLowerCase()}%`)
+            .gte('id', `${shortId}-0000-0000-0000-000000000000`)
+            .lte('id', `${shortId}-ffff-ffff-ffff-ffffffffffff`)
             .limit(1);
 
         if (error || !data || data.length === 0) return null;
@@ -146,13 +170,14 @@ export const fetchContentBySlug = async (slug: string, client?: SupabaseClient):
     }
 
     // Fallback to old slug format (title search with underscores)
+    // Escaped so a stray % in the URL cannot turn the lookup into a wildcard scan
     const title = slug.replace(/_/g, ' ');
 
     const { data, error } = await sb
         .from('content')
         .select('*')
         .eq('status', 'published')
-        .ilike('title', title)
+        .ilike('title', escapeLikePattern(title))
         .single();
 
     if (error) return null;
@@ -166,9 +191,9 @@ export const searchContent = async (query: string, limit = 10, client?: Supabase
     const sb = client || getSupabaseClient();
     const { data, error } = await sb
         .from('content')
-        .select('id, gdvg_id, title, poster_path, backdrop_path, content_type, release_date, first_air_date, vote_average, origin_country, genres')
+        .select(CONTENT_CARD_COLUMNS)
         .eq('status', 'published')
-        .ilike('title', `%${query}%`)
+        .ilike('title', containsPattern(query))
         .limit(limit);
 
     if (error) return [];
@@ -191,7 +216,7 @@ export const fetchSimilarContent = async (
 
     const { data, error } = await sb
         .from('content')
-        .select('*')
+        .select(CONTENT_CARD_COLUMNS)
         .eq('status', 'published')
         .neq('id', contentId)
         .order('popularity', { ascending: false })
@@ -199,7 +224,7 @@ export const fetchSimilarContent = async (
 
     if (error) return [];
 
-    const normalized = normalizeContentArray(data || []);
+    const normalized = normalizeContentArray((data || []) as unknown as Content[]);
     return normalized.filter(item =>
         item.genres?.some((g: any) => g.name === genreName)
     ).slice(0, limit);
@@ -231,16 +256,16 @@ export const fetchRecommendations = async (
 
     if (tmdbIds.length === 0) return [];
 
-    // Fetch full content details for published items
+    // Fetch card details for published items
     const { data, error } = await sb
         .from('content')
-        .select('*')
+        .select(CONTENT_CARD_COLUMNS)
         .eq('status', 'published')
         .in('tmdb_id', tmdbIds)
         .limit(limit);
 
     if (error) return [];
-    return normalizeContentArray(data || []);
+    return normalizeContentArray((data || []) as unknown as Content[]);
 };
 
 // ============ Cast & Crew Queries ============
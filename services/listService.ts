@@ -2,11 +2,23 @@ import { getSupabaseClient } from '../lib/supabase';
 import type { SupabaseClient } from '@supabase/supabase-js';
 import type { UserListEntry, WatchStatus } from '../types';
 
+// Only the columns mapped onto UserListEntry
+const LIST_ENTRY_COLUMNS = 'id, drama_id, user_id, status, progress, score';
+
+const mapListEntry = (row: any): UserListEntry => ({
+  id: String(row.id),
+  dramaId: String(row.drama_id),
+  userId: row.user_id,
+  status: row.status || 'Plan to Watch',
+  progress: row.progress || 0,
+  score: row.score || 0
+});
+
 export const fetchUserList = async (userId: string, client?: SupabaseClient): Promise<UserListEntry[]> => {
   const sb = client || getSupabaseClient();
   const { data, error } = await sb
     .from('favorites')
-    .select('*')
+    .select(LIST_ENTRY_COLUMNS)
     .eq('user_id', userId);
 
   if (error) {
@@ -14,14 +26,25 @@ export const fetchUserList = async (userId: string, client?: SupabaseClient): Pr
       throw error;
   }
 
-  return (data || []).map((row: any) => ({
-    id: String(row.id),
-    dramaId: String(row.drama_id),
-    userId: row.user_id,
-    status: row.status || 'Plan to Watch',
-    progress: row.progress || 0,
-    score: row.score || 0
-  }));
+  return (data || []).map(mapListEntry);
+};
+
+export const fetchUserListEntry = async (userId: string, dramaId: string, client?: SupabaseClient): Promise<UserListEntry | null> => {
+  const sb = client || getSupabaseClient();
+  const { data, error } = await sb
+    .from('favorites')
+    .select(LIST_ENTRY_COLUMNS)
+    .eq('user_id', userId)
+    .eq('drama_id', dramaId)
+    .limit(1) // (user_id, drama_id) isn't guaranteed unique; don't error on duplicates
+    .maybeSingle();
+
+  if (error) {
+      if (error.code === 'PGRST205') return null;
+      throw error;
+  }
+
+  return data ? mapListEntry(data) : null;
 };
 
 export const updateUserListEntry = async (
@@ -31,25 +54,23 @@ export const updateUserListEntry = async (
     client?: SupabaseClient
 ): Promise<UserListEntry> => {
     const sb = client || getSupabaseClient();
-    const { data: existing } = await sb
+
+    // Try the update first: editing an existing entry (the common case) then
+    // costs one round trip instead of a lookup followed by a write.
+    // favorites has no guaranteed unique (user_id, drama_id) constraint, so
+    // read the result as a list: duplicate rows are all updated alike and the
+    // first is returned, rather than maybeSingle() erroring on every edit
+    const { data: updated, error: updateError } = await sb
         .from('favorites')
-        .select('id')
+        .update(updates)
         .eq('user_id', userId)
         .eq('drama_id', dramaId)
-        .single();
+        .select(LIST_ENTRY_COLUMNS);
+    if (updateError) throw updateError;
 
-    let result;
-    
-    if (existing) {
-        const { data, error } = await sb
-            .from('favorites')
-            .update(updates)
-            .eq('id', existing.id)
-            .select()
-            .single();
-        if (error) throw error;
-        result = data;
-    } else {
+    let result = updated?.[0];
+
+    if (!result) {
         const { data, error } = await sb
             .from('favorites')
             .insert({
@@ -57,20 +78,13 @@ export const updateUserListEntry = async (
                 drama_id: dramaId,
                 ...updates
             })
-            .select()
+            .select(LIST_ENTRY_COLUMNS)
             .single();
         if (error) throw error;
         result = data;
     }
 
-    return {
-        id: String(result.id),
-        dramaId: String(result.drama_id),
-        userId: result.user_id,
-        status: result.status,
-        progress: result.progress,
-        score: result.score
-    };
+    return mapListEntry(result);
 };
 
 export const removeFromUserList = async (userId: string, dramaId: string, client?: SupabaseClient): Promise<void> => {
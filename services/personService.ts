@@ -6,6 +6,8 @@
 import { getSupabaseClient } from '../lib/supabase';
 import type { SupabaseClient } from '@supabase/supabase-js';
 import type { Person, Content } from '../types';
+import { GDVG_ID_RE, UUID_RE } from '../lib/urlHelper';
+import { escapeLikePattern, containsPattern, chunkInFilterValues } from '../lib/queryHelpers';
 
 // ============ Public Queries ============
 
@@ -25,22 +27,17 @@ export const fetchAllPeople = async (
     const from = (page - 1) * pageSize;
     const to = from + pageSize - 1;
 
-    // Get total count efficiently
     const sb = client || getSupabaseClient();
 
-    // Get total count efficiently
-    const { count } = await sb
-        .from('people')
-        .select('*', { count: 'exact', head: true })
-        .not('profile_path', 'is', null);
-
     // Determine order column
     const orderColumn = sortBy === 'credits' ? 'combined_credits_count' : 'popularity';
 
-    // Get paginated data with dynamic sorting
-    const { data, error } = await sb
+    // Fetch the page and the total in one request. The count is exact: it is
+    // filtered and drives the pager's last page, so a planner estimate could
+    // hide real pages or point at empty ones
+    const { data, count, error } = await sb
         .from('people')
-        .select('*')
+        .select('*', { count: 'exact' })
         .not('profile_path', 'is', null)
         .order(orderColumn, { ascending: false, nullsFirst: false })
         .range(from, to);
@@ -94,22 +91,23 @@ export const getPersonByGdvgId = async (gdvgId: number | string, client?: Supaba
  */
 export const getPersonByName = async (nameOrId: string, client?: SupabaseClient): Promise<Person | null> => {
     // Check if it's a pure number (GDVG-ID)
-    if (/^\d+$/.test(nameOrId)) {
+    if (GDVG_ID_RE.test(nameOrId)) {
         return await getPersonByGdvgId(parseInt(nameOrId, 10), client);
     }
 
     // Check if it's a UUID
-    const isUUID = /^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$/i.test(nameOrId);
-    if (isUUID) {
+    if (UUID_RE.test(nameOrId)) {
         return await getPersonById(nameOrId, client);
     }
 
-    // Otherwise treat as name (backward compatibility)
+    // Otherwise treat as name (backward compatibility), matched literally.
+    // Legacy name URLs use underscores for spaces (e.g. "Lee_Min_Ho")
+    const name = nameOrId.replace(/_/g, ' ');
     const sb = client || getSupabaseClient();
     const { data, error } = await sb
         .from('people')
         .select('*')
-        .ilike('name', nameOrId)
+        .ilike('name', escapeLikePattern(name))
         .limit(1)
         .single();
 
@@ -125,7 +123,7 @@ export const searchPeople = async (query: string, limit = 5, client?: SupabaseCl
     const { data, error } = await sb
         .from('people')
         .select('id, gdvg_id, tmdb_id, name, profile_path, known_for_department')
-        .ilike('name', `%${query}%`)
+        .ilike('name', containsPattern(query))
         .order('popularity', { ascending: false })
         .limit(limit);
 
@@ -138,17 +136,17 @@ export const searchPeople = async (query: string, limit = 5, client?: SupabaseCl
  */
 export const getFilmographyByPersonId = async (personId: string, client?: SupabaseClient): Promise<Content[]> => {
     const sb = client || getSupabaseClient();
-    // Get content IDs from cast
-    const { data: castData } = await sb
-        .from('content_cast')
-        .select('content_id')
-        .eq('person_id', personId);
-
-    // Get content IDs from crew  
-    const { data: crewData } = await sb
-        .from('content_crew')
-        .select('content_id')
-        .eq('person_id', personId);
+    // Get content IDs from cast and crew (independent lookups, run together)
+    const [{ data: castData }, { data: crewData }] = await Promise.all([
+        sb
+            .from('content_cast')
+            .select('content_id')
+            .eq('person_id', personId),
+        sb
+            .from('content_crew')
+            .select('content_id')
+            .eq('person_id', personId),
+    ]);
 
     // Combine unique content IDs
     const contentIds = new Set<string>();
@@ -220,11 +218,63 @@ export const deletePerson = async (id: string, client?: SupabaseClient): Promise
     if (error) throw error;
 };
 
+const BULK_INSERT_BATCH_SIZE = 1000;
+
 /**
  * Bulk import people (admin use)
+ * Inserts in batches so large imports stay under PostgREST request limits.
+ * People whose tmdb_id already exists (in the table or earlier in the same
+ * import) are skipped, using a few chunked lookups per batch rather than one per row.
+ *
+ * Batches are separate inserts, not one transaction: if a batch fails, the
+ * batches before it stay committed and the error is thrown. onProgress is
+ * called after every completed batch, so a caller still knows how far a
+ * failed import got, and re-running the same import skips what already landed.
+ * @param onProgress - Optional callback with the running totals after each batch
+ * @returns How many rows were inserted and how many were skipped as duplicates
  */
-export const bulkImportPeople = async (people: Partial<Person>[], client?: SupabaseClient): Promise<void> => {
+export const bulkImportPeople = async (
+    people: Partial<Person>[],
+    client?: SupabaseClient,
+    onProgress?: (progress: { inserted: number, skipped: number }) => void
+): Promise<{ inserted: number, skipped: number }> => {
     const sb = client || getSupabaseClient();
-    const { error } = await sb.from('people').insert(people);
-    if (error) throw error;
+    const seenTmdbIds = new Set<number>();
+    let inserted = 0;
+    let skipped = 0;
+
+    for (let i = 0; i < people.length; i += BULK_INSERT_BATCH_SIZE) {
+        const batch = people.slice(i, i + BULK_INSERT_BATCH_SIZE);
+        const tmdbIds = batch
+            .map(p => p.tmdb_id)
+            .filter((id): id is number => id != null);
+
+        for (const ids of chunkInFilterValues(tmdbIds)) {
+            const { data: existing, error: lookupError } = await sb
+                .from('people')
+                .select('tmdb_id')
+                .in('tmdb_id', ids);
+
+            if (lookupError) throw lookupError;
+            existing?.forEach(row => seenTmdbIds.add(row.tmdb_id));
+        }
+
+        const fresh = batch.filter(p => {
+            if (p.tmdb_id == null) return true;
+            if (seenTmdbIds.has(p.tmdb_id)) return false;
+            seenTmdbIds.add(p.tmdb_id);
+            return true;
+        });
+        skipped += batch.length - fresh.length;
+
+        if (fresh.length > 0) {
+            const { error } = await sb.from('people').insert(fresh);
+            if (error) throw error;
+            inserted += fresh.length;
+        }
+
+        onProgress?.({ inserted, skipped });
+    }
+
+    return { inserted, skipped };
 };
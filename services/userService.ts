@@ -1,12 +1,23 @@
 import { getSupabaseClient } from '../lib/supabase';
 import type { SupabaseClient } from '@supabase/supabase-js';
 import type { UserProfile } from '../types';
+import { chunkInFilterValues } from '../lib/queryHelpers';
+
+// Only the columns mapped onto UserProfile
+const PROFILE_COLUMNS = 'id, username, avatar_url, updated_at';
+
+const mapProfile = (row: any): UserProfile => ({
+  id: row.id,
+  username: row.username,
+  avatarUrl: row.avatar_url,
+  updatedAt: row.updated_at
+});
 
 export const getUserProfile = async (userId: string, client?: SupabaseClient): Promise<UserProfile | null> => {
   const sb = client || getSupabaseClient();
   const { data, error } = await sb
     .from('user_profiles')
-    .select('*')
+    .select(PROFILE_COLUMNS)
     .eq('id', userId)
     .single();
 
@@ -19,12 +30,52 @@ export const getUserProfile = async (userId: string, client?: SupabaseClient): P
       return null;
   }
 
-  return {
-    id: data.id,
-    username: data.username,
-    avatarUrl: data.avatar_url,
-    updatedAt: data.updated_at
-  };
+  return mapProfile(data);
+};
+
+export const userProfileExists = async (userId: string, client?: SupabaseClient): Promise<boolean> => {
+  const sb = client || getSupabaseClient();
+  const { data, error } = await sb
+    .from('user_profiles')
+    .select('id')
+    .eq('id', userId)
+    .maybeSingle();
+
+  if (error) {
+    console.warn('Profile check warning:', error.message);
+    return false;
+  }
+
+  return !!data;
+};
+
+export const fetchUserProfiles = async (userIds: string[], client?: SupabaseClient): Promise<Map<string, UserProfile>> => {
+  const profiles = new Map<string, UserProfile>();
+  const uniqueIds = Array.from(new Set(userIds));
+  if (uniqueIds.length === 0) return profiles;
+
+  const sb = client || getSupabaseClient();
+  // Reviews/discussions are unbounded, so split the ids to keep each GET short
+  const results = await Promise.all(
+    chunkInFilterValues(uniqueIds).map(ids =>
+      sb
+        .from('user_profiles')
+        .select(PROFILE_COLUMNS)
+        .in('id', ids)
+    )
+  );
+
+  for (const { data, error } of results) {
+    if (error) {
+      console.warn('Profiles fetch warning:', error.message);
+      continue;
+    }
+    for (const row of data || []) {
+      profiles.set(row.id, mapProfile(row));
+    }
+  }
+
+  return profiles;
 };
 
 export const createDefaultProfile = async (userId: string, client?: SupabaseClient): Promise<UserProfile | null> => {
@@ -48,17 +99,12 @@ export const updateUserProfile = async (userId: string, updates: { username?: st
       updated_at: new Date().toISOString(),
     })
     .eq('id', userId)
-    .select()
+    .select(PROFILE_COLUMNS)
     .single();
 
   if (error) throw error;
 
-  return {
-    id: data.id,
-    username: data.username,
-    avatarUrl: data.avatar_url,
-    updatedAt: data.updated_at
-  };
+  return mapProfile(data);
 };
 
 export const upsertUserProfile = async (userId: string, profile: { username: string; avatarUrl: string; email?: string }, client?: SupabaseClient): Promise<UserProfile> => {
@@ -76,42 +122,32 @@ export const upsertUserProfile = async (userId: string, profile: { username: str
     const { data, error } = await sb
         .from('user_profiles')
         .upsert(payload)
-        .select()
+        .select(PROFILE_COLUMNS)
         .single();
 
     if (error) throw error;
 
-    return {
-        id: data.id,
-        username: data.username,
-        avatarUrl: data.avatar_url,
-        updatedAt: data.updated_at
-    };
+    return mapProfile(data);
 };
 
 export const syncGoogleUserData = async (userId: string, metadata: any, client?: SupabaseClient) => {
     try {
         const sb = client || getSupabaseClient();
-        const { data: currentProfile } = await sb
-            .from('user_profiles')
-            .select('avatar_url, username')
-            .eq('id', userId)
-            .single();
-
         const googleAvatar = metadata.avatar_url || metadata.picture;
         const googleName = metadata.full_name || metadata.name || metadata.email?.split('@')[0];
         const googleEmail = metadata.email;
 
-        if (!currentProfile) {
-            await sb.from('user_profiles').upsert({
-                id: userId,
-                username: googleName,
-                avatar_url: googleAvatar || `https://api.dicebear.com/9.x/adventurer/svg?seed=${userId}`,
-                email: googleEmail
-            }).then(({ error }) => {
-                if (error) console.warn("Google sync silent fail (RLS likely):", error.code);
-            });
-        }
+        // Seed the profile only if none exists yet: ignoreDuplicates turns the
+        // upsert into INSERT ... ON CONFLICT DO NOTHING, so an existing profile
+        // is left untouched without a separate lookup first
+        const { error } = await sb.from('user_profiles').upsert({
+            id: userId,
+            username: googleName,
+            avatar_url: googleAvatar || `https://api.dicebear.com/9.x/adventurer/svg?seed=${userId}`,
+            email: googleEmail
+        }, { onConflict: 'id', ignoreDuplicates: true });
+
+        if (error) console.warn("Google sync silent fail (RLS likely):", error.code);
     } catch (err) {
         console.error("Error syncing Google profile:", err);
     }